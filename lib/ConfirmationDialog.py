@@ -1,14 +1,12 @@
 import os
-import random
+import threading
 from tkinter import ttk, Frame, Label, Scrollbar, Canvas, Toplevel
 from lib.ToolTip import ToolTip
 from lib.ImportCheck import import_PIL
 
-Image, ImageTk = import_PIL()
-
 class ConfirmationDialog:
     """A custom dialog to confirm deletion with image previews."""
-    def __init__(self, parent, app, year, month, image_paths):
+    def __init__(self, parent, app, year, month, plan):
         self.parent = parent
         self.app = app
         self.confirmed = False
@@ -23,7 +21,10 @@ class ConfirmationDialog:
             msg = self.app._('confirm_delete_msg', year, month)
         else:
             msg = self.app._('confirm_delete_msg', year=year, month=month)
-        Label(self.top, text=msg, justify='left', padx=10, pady=10).pack()
+        # Totals come from the per-month aggregates, so this is instant for any selection size
+        summary = self.app._('confirm_delete_summary', f"{plan.count:,}", f"{plan.size / (1024 * 1024):,.2f}")
+        Label(self.top, text=summary, justify='left', padx=10).pack(pady=(10, 0))
+        Label(self.top, text=msg, justify='left', padx=10).pack(pady=(0, 10))
 
         # Thumbnails Frame
         thumb_frame = Frame(self.top, bd=2, relief='sunken')
@@ -41,7 +42,7 @@ class ConfirmationDialog:
         scrollbar.pack(side="right", fill="y")
         
         self.photo_references = [] # IMPORTANT: Keep reference to avoid garbage collection
-        self.load_thumbnails(image_paths)
+        self.load_thumbnails(plan)
 
         # Buttons
         button_frame = Frame(self.top, pady=5)
@@ -49,30 +50,42 @@ class ConfirmationDialog:
         ttk.Button(button_frame, text=self.app._('cancel_btn'), command=self.cancel).pack(side='right', padx=10)
         ttk.Button(button_frame, text=self.app._('confirm_btn'), command=self.confirm).pack(side='right')
 
-    def load_thumbnails(self, image_paths):
-        """Load a sample of images and display them."""
+    def load_thumbnails(self, plan):
+        """Load a sample of images in the background and display them."""
         sample_size = 20
-        paths_to_show = random.sample(image_paths, min(len(image_paths), sample_size))
-        
-        for i, path in enumerate(paths_to_show):
+        paths_to_show = plan.preview_sample(sample_size, self.app.cache_source.preview_extensions)
+        threading.Thread(target=self._load_thumbnails_thread, args=(paths_to_show,), daemon=True).start()
+
+    def _load_thumbnails_thread(self, paths_to_show):
+        images = []
+        for path in paths_to_show:
             try:
-                image = Image.open(path)
+                image = self.app.cache_source.open_image(path)
                 image.thumbnail((100, 100)) # Resize in-place
-                photo = ImageTk.PhotoImage(image)
-                self.photo_references.append(photo)
-
-                row, col = divmod(i, 4)
-                item_frame = Frame(self.scrollable_frame)
-                item_frame.grid(row=row, column=col, padx=5, pady=5)
-                
-                img_label = Label(item_frame, image=photo)
-                img_label.pack()
-                
-                # Show filename as a tooltip
-                ToolTip(img_label, os.path.basename(path))
-
+                images.append((path, image))
             except Exception as e:
                 print(f"Could not load thumbnail for {path}: {e}")
+        # Schedule on the parent, which outlives this dialog if it is closed early
+        self.parent.after(0, lambda: self.populate_thumbnails(images))
+
+    def populate_thumbnails(self, images):
+        """Place the decoded sample onto the dialog (runs on the Tk thread)."""
+        if not self.top.winfo_exists():
+            return
+        _, ImageTk = import_PIL()
+        for i, (path, image) in enumerate(images):
+            photo = ImageTk.PhotoImage(image)
+            self.photo_references.append(photo)
+
+            row, col = divmod(i, 4)
+            item_frame = Frame(self.scrollable_frame)
+            item_frame.grid(row=row, column=col, padx=5, pady=5)
+            
+            img_label = Label(item_frame, image=photo)
+            img_label.pack()
+            
+            # Show filename as a tooltip
+            ToolTip(img_label, os.path.basename(path))
 
     def confirm(self):
         self.confirmed = True
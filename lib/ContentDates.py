@@ -0,0 +1,144 @@
+import os
+import sys
+import sqlite3
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Files copied, restored or synced between machines all end up with the same
+# mtime. The "content date" is the EXIF DateTimeOriginal of an image where it has
+# one, otherwise the file's creation time. Images are opened through the cache
+# source's open_image, so WeChat .dat files are decoded first; plain image files
+# only have their headers read. Every result is cached per (path, size, mtime)
+# so it is computed once per file.
+
+EXIF_IFD = 0x8769
+EXIF_DATETIME_ORIGINAL = 36867
+EXIF_DATETIME = 306
+EXIF_DATE_FORMAT = '%Y:%m:%d %H:%M:%S'
+EARLIEST_PLAUSIBLE_YEAR = 1990
+BATCH_SIZE = 512
+
+def get_cache_dir():
+    """Return (and create) the per-user cache folder of the application."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    path = os.path.join(base, 'QQGroupImagesCleaner')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _parse_exif_date(value):
+    if not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.strptime(value.strip('\x00 ')[:19], EXIF_DATE_FORMAT)
+    except ValueError:
+        return None # e.g. "0000:00:00 00:00:00"
+    if not (EARLIEST_PLAUSIBLE_YEAR <= dt.year <= datetime.now().year + 1):
+        return None
+    return dt.timestamp()
+
+def _open_with_pillow(path):
+    from PIL import Image
+    return Image.open(path)
+
+def read_content_date(path, stat, open_image=None):
+    """Return the content timestamp of `path`: EXIF date if present, else its creation time.
+
+    `open_image` is the active CacheSource.open_image; plain Pillow is used if omitted.
+    """
+    try:
+        # Opening is lazy: only the header (including the EXIF block) is parsed
+        with (open_image or _open_with_pillow)(path) as image:
+            exif = image.getexif()
+            timestamp = _parse_exif_date(exif.get_ifd(EXIF_IFD).get(EXIF_DATETIME_ORIGINAL)) \
+                or _parse_exif_date(exif.get(EXIF_DATETIME))
+        if timestamp is not None:
+            return timestamp
+    except Exception:
+        pass # Not an image, no EXIF, or Pillow is missing
+
+    birth_time = getattr(stat, 'st_birthtime', None)
+    if birth_time:
+        return birth_time
+    if sys.platform == 'win32':
+        return stat.st_ctime # Creation time on Windows
+    return stat.st_mtime # Linux has no portable creation time
+
+class ContentDateCache:
+    """SQLite-backed cache of content dates keyed by path and validated by size and mtime.
+
+    A connection can only be used by the thread that opened it.
+    """
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(get_cache_dir(), 'content_dates.sqlite3')
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS content_dates ("
+            " path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, content_time REAL)"
+        )
+
+    def load(self, prefix=''):
+        """Return {path: (size, mtime_ns, content_time)} for every cached path under `prefix`."""
+        rows = self.conn.execute(
+            "SELECT path, size, mtime_ns, content_time FROM content_dates WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix)
+        )
+        return {path: (size, mtime_ns, content_time) for path, size, mtime_ns, content_time in rows}
+
+    def put_many(self, rows):
+        """Store [(path, size, mtime_ns, content_time), ...]."""
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO content_dates VALUES (?, ?, ?, ?)", rows)
+
+    def close(self):
+        self.conn.close()
+
+def _resolve(path, cached, open_image):
+    """Runs on the worker pool: (path, size, mtime_ns, content_time, is_new), or None if gone."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    hit = cached.get(path)
+    if hit is not None and hit[0] == stat.st_size and hit[1] == stat.st_mtime_ns:
+        return path, stat.st_size, stat.st_mtime_ns, hit[2], False
+    return path, stat.st_size, stat.st_mtime_ns, read_content_date(path, stat, open_image), True
+
+def resolve_content_dates(paths, cache, cached, open_image=None, on_progress=None, max_workers=8):
+    """Yield (path, size, content_time) for `paths`, reading headers only for cache misses.
+
+    Work is done in batches on a thread pool; new results are written to `cache`
+    once per batch. `cached` is the dict returned by cache.load() and is only read;
+    `open_image` is passed on to read_content_date.
+    """
+    done = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        batch = []
+        for path in paths:
+            batch.append(path)
+            if len(batch) < BATCH_SIZE:
+                continue
+            yield from _resolve_batch(executor, batch, cache, cached, open_image)
+            done += len(batch)
+            batch = []
+            if on_progress:
+                on_progress(done)
+        if batch:
+            yield from _resolve_batch(executor, batch, cache, cached, open_image)
+            done += len(batch)
+            if on_progress:
+                on_progress(done)
+
+def _resolve_batch(executor, batch, cache, cached, open_image):
+    new_rows = []
+    for result in executor.map(lambda path: _resolve(path, cached, open_image), batch):
+        if result is None:
+            continue
+        path, size, mtime_ns, content_time, is_new = result
+        if is_new:
+            new_rows.append((path, size, mtime_ns, content_time))
+        yield path, size, content_time
+    if new_rows:
+        cache.put_many(new_rows)
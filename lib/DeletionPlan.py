@@ -0,0 +1,70 @@
+import random
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
+
+class DeletionPlan:
+    """Describes the files to delete for "this month and before" without copying any path lists.
+
+    Totals come straight from the per-month aggregates of the scan result, preview
+    samples are drawn per month by random index, and the targets themselves are
+    streamed to the deletion worker one month at a time.
+    """
+    def __init__(self, file_data, target_year, target_month):
+        self.target_year = target_year
+        self.target_month = target_month
+        # Only references to the per-month entries are kept, never copies of their paths
+        self.months = [
+            (year, month, data)
+            for year, months in file_data.items()
+            for month, data in months.items()
+            if year < target_year or (year == target_year and month <= target_month)
+        ]
+        self.count = sum(len(data['paths']) for _, _, data in self.months)
+        self.size = sum(data['size'] for _, _, data in self.months)
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __len__(self):
+        return self.count
+
+    def iter_paths(self):
+        """Yield every target path lazily, month by month."""
+        for _, _, data in self.months:
+            yield from data['paths']
+
+    def preview_sample(self, sample_size, extensions=IMAGE_EXTENSIONS, max_attempts_factor=5):
+        """Return up to `sample_size` random image paths, stratified by month.
+
+        Each month gets a share of the sample proportional to its file count, and
+        candidates are picked by random index so the cost depends on the sample size
+        rather than on the number of files in the plan.
+        """
+        if not self.count or sample_size <= 0:
+            return []
+
+        # Largest-remainder allocation of the sample across months
+        quotas = []
+        for _, _, data in self.months:
+            exact = sample_size * len(data['paths']) / self.count
+            quotas.append([int(exact), exact - int(exact), data['paths']])
+        remaining = sample_size - sum(q[0] for q in quotas)
+        for quota in sorted(quotas, key=lambda q: q[1], reverse=True)[:remaining]:
+            quota[0] += 1
+
+        sample = []
+        for quota, _, paths in quotas:
+            if quota == 0 or not paths:
+                continue
+            picked = set()
+            # Non-image files are rejected, so allow a bounded number of extra draws
+            for _ in range(quota * max_attempts_factor):
+                if len(picked) >= quota or len(picked) >= len(paths):
+                    break
+                index = random.randrange(len(paths))
+                if index not in picked and paths[index].lower().endswith(extensions):
+                    picked.add(index)
+            sample.extend(paths[i] for i in picked)
+
+        random.shuffle(sample)
+        return sample
@@ -1,3 +1,4 @@
+import importlib
 from tkinter import messagebox
 def import_PIL():
     try:
@@ -6,5 +7,15 @@ def import_PIL():
         messagebox.showerror("Dependency Missing", "Pillow library not found.\nPlease install it by running: pip install Pillow")
         exit()
     return Image, ImageTk
-    
-        
+
+def preload_modules(module_names):
+    """Import modules ahead of first use so that opening a window later is instant.
+
+    Intended to run in a background thread once the main window is visible.
+    Failures are ignored here; the real import at first use reports them.
+    """
+    for name in module_names:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"--- WARNING: Could not preload module '{name}'. Reason: {e}")
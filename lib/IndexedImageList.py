@@ -0,0 +1,64 @@
+class IndexedImageList:
+    """Image records ({'path', 'size', 'time'}) in display order with O(1) lookup and removal.
+
+    A removal only drops the path from the index and leaves a tombstone in the
+    ordered list. Tombstones are compacted in one pass the next time positions are
+    needed (paging, range selection, sorting), so deleting a batch of k images costs
+    O(k) plus a single O(n) compaction instead of O(n) per image.
+    """
+    def __init__(self, records=()):
+        self._items = list(records)
+        self._index = {record['path']: i for i, record in enumerate(self._items)}
+        self._tombstones = 0
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, path):
+        return path in self._index
+
+    def __iter__(self):
+        return (record for record in self._items if record is not None)
+
+    def get(self, path):
+        position = self._index.get(path)
+        return None if position is None else self._items[position]
+
+    def remove(self, path):
+        """Remove `path` in constant time and return its record (or None if absent)."""
+        position = self._index.pop(path, None)
+        if position is None:
+            return None
+        record = self._items[position]
+        self._items[position] = None
+        self._tombstones += 1
+        return record
+
+    def compact(self):
+        if not self._tombstones:
+            return
+        self._items = [record for record in self._items if record is not None]
+        self._index = {record['path']: i for i, record in enumerate(self._items)}
+        self._tombstones = 0
+
+    def sort(self, key, reverse=False):
+        self.compact()
+        self._items.sort(key=key, reverse=reverse)
+        self._index = {record['path']: i for i, record in enumerate(self._items)}
+
+    def slice(self, start, end):
+        self.compact()
+        return self._items[start:end]
+
+    def position(self, path):
+        self.compact()
+        return self._index.get(path)
+
+    def paths_between(self, path_a, path_b):
+        """Return the paths from `path_a` to `path_b` inclusive, in display order."""
+        a, b = self.position(path_a), self.position(path_b)
+        if a is None or b is None:
+            return []
+        if a > b:
+            a, b = b, a
+        return [record['path'] for record in self._items[a:b + 1]]
@@ -0,0 +1,146 @@
+import time
+import tkinter
+from collections import deque
+
+# Upper bounds (ms) of the heartbeat lag histogram buckets; the last bucket is open-ended
+LAG_BUCKETS_MS = (16, 50, 100, 250, 500, 1000)
+
+def unwrap_after_callback(func):
+    """Return the function behind tkinter's after() wrapper (a local `callit` function)."""
+    code = getattr(func, '__code__', None)
+    if code is not None and code.co_name == 'callit' and 'func' in code.co_freevars:
+        try:
+            return func.__closure__[code.co_freevars.index('func')].cell_contents
+        except (ValueError, IndexError):
+            pass
+    return func
+
+def describe_callback(func):
+    """Return a readable name for a Tk callback, e.g. 'QQCleanerApp.finish_scan'.
+
+    Lambdas get their source location appended since their name alone says nothing.
+    """
+    func = unwrap_after_callback(func)
+    func = getattr(func, '__func__', func) # Bound methods
+    name = getattr(func, '__qualname__', None) or type(func).__qualname__
+    code = getattr(func, '__code__', None)
+    if code is not None and '<lambda>' in name:
+        name = f"{name} ({code.co_filename.replace(chr(92), '/').rsplit('/', 1)[-1]}:{code.co_firstlineno})"
+    return name
+
+class _TimedCallWrapper(tkinter.CallWrapper):
+    """CallWrapper that reports how long every Tk callback ran to the active monitor."""
+    monitor = None
+
+    def __call__(self, *args):
+        monitor = _TimedCallWrapper.monitor
+        if monitor is None:
+            return super().__call__(*args)
+        start = time.perf_counter()
+        try:
+            return super().__call__(*args)
+        finally:
+            monitor.record_callback(self.func, time.perf_counter() - start)
+
+class LagMonitor:
+    """Measures how long the Tk event loop is blocked.
+
+    A heartbeat scheduled every `interval_ms` records how late it actually runs
+    (the scheduling delay every other event suffered too), and every callback Tk
+    dispatches is timed so the slowest ones can be attributed by name. Callbacks
+    are only timed if they were registered after start().
+    """
+    def __init__(self, root, interval_ms=50, max_samples=10000):
+        self.root = root
+        self.interval = interval_ms / 1000
+        self.lags = deque(maxlen=max_samples) # Recent heartbeat lags in seconds
+        self.histogram = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.callbacks = {} # name -> [count, total seconds, max seconds]
+        self._names = {} # code object -> name, so each callback is described once
+        self._expected = None
+        self._after_id = None
+        self._original_call_wrapper = None
+
+    def start(self):
+        _TimedCallWrapper.monitor = self
+        if tkinter.CallWrapper is not _TimedCallWrapper:
+            self._original_call_wrapper = tkinter.CallWrapper
+            tkinter.CallWrapper = _TimedCallWrapper
+        self._expected = time.perf_counter() + self.interval
+        self._after_id = self.root.after(int(self.interval * 1000), self._tick)
+
+    def stop(self):
+        if _TimedCallWrapper.monitor is self:
+            _TimedCallWrapper.monitor = None
+        if self._original_call_wrapper is not None:
+            # Callbacks registered while the monitor ran keep their (now inert) timed wrapper
+            tkinter.CallWrapper = self._original_call_wrapper
+            self._original_call_wrapper = None
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def reset(self):
+        self.lags.clear()
+        self.histogram = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.callbacks.clear()
+
+    def _tick(self):
+        now = time.perf_counter()
+        lag = max(now - self._expected, 0.0)
+        self.lags.append(lag)
+        lag_ms = lag * 1000
+        bucket = next((i for i, bound in enumerate(LAG_BUCKETS_MS) if lag_ms < bound), len(LAG_BUCKETS_MS))
+        self.histogram[bucket] += 1
+        self._expected = now + self.interval
+        self._after_id = self.root.after(int(self.interval * 1000), self._tick)
+
+    def record_callback(self, func, duration):
+        func = unwrap_after_callback(func)
+        code = getattr(func, '__code__', None)
+        name = self._names.get(code)
+        if name is None:
+            name = describe_callback(func)
+            if code is not None:
+                self._names[code] = name
+        if name == 'LagMonitor._tick':
+            return
+        entry = self.callbacks.get(name)
+        if entry is None:
+            self.callbacks[name] = [1, duration, duration]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+            if duration > entry[2]:
+                entry[2] = duration
+
+    def percentile(self, fraction):
+        """Heartbeat lag (seconds) at the given fraction, e.g. 0.95, over recent samples."""
+        if not self.lags:
+            return 0.0
+        ordered = sorted(self.lags)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def slowest_callbacks(self, limit=10):
+        """Return [(name, count, total seconds, max seconds)] ordered by the longest single run."""
+        rows = [(name, c, total, longest) for name, (c, total, longest) in self.callbacks.items()]
+        return sorted(rows, key=lambda row: row[3], reverse=True)[:limit]
+
+    def report(self, limit=10):
+        """Return a plain-text summary of the lag histogram and the slowest callbacks."""
+        lines = [
+            f"Heartbeat every {self.interval * 1000:.0f} ms, {len(self.lags)} recent samples",
+            f"Lag p50 {self.percentile(0.5) * 1000:.1f} ms, p95 {self.percentile(0.95) * 1000:.1f} ms, "
+            f"p99 {self.percentile(0.99) * 1000:.1f} ms, max {max(self.lags, default=0) * 1000:.1f} ms",
+            "",
+            "Lag histogram:",
+        ]
+        lower = 0
+        for bound, count in zip(LAG_BUCKETS_MS + (None,), self.histogram):
+            label = f"{lower}-{bound} ms" if bound is not None else f">= {lower} ms"
+            lines.append(f"  {label:>14}: {count}")
+            lower = bound
+        lines += ["", "Slowest callbacks (max / total ms, calls):"]
+        for name, count, total, longest in self.slowest_callbacks(limit):
+            lines.append(f"  {longest * 1000:8.1f} / {total * 1000:9.1f}  x{count:<6} {name}")
+        return "\n".join(lines)
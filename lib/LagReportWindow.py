@@ -0,0 +1,37 @@
+from tkinter import ttk, Frame, Scrollbar, Text, Toplevel
+
+class LagReportWindow:
+    """Shows the event-loop lag histogram and the slowest UI callbacks."""
+    def __init__(self, parent, app, monitor):
+        self.app = app
+        self.monitor = monitor
+
+        self.top = Toplevel(parent)
+        self.top.title(self.app._('lag_report_title'))
+        self.top.minsize(560, 400)
+        self.top.transient(parent)
+
+        text_frame = Frame(self.top, padx=10, pady=10)
+        text_frame.pack(fill='both', expand=True)
+        self.text = Text(text_frame, wrap='none', font=('Courier', 9))
+        scrollbar = Scrollbar(text_frame, orient='vertical', command=self.text.yview)
+        self.text.configure(yscrollcommand=scrollbar.set)
+        self.text.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+
+        button_frame = Frame(self.top, pady=5)
+        button_frame.pack()
+        ttk.Button(button_frame, text=self.app._('lag_report_refresh'), command=self.refresh).pack(side='left', padx=5)
+        ttk.Button(button_frame, text=self.app._('lag_report_reset'), command=self.reset).pack(side='left', padx=5)
+
+        self.refresh()
+
+    def refresh(self):
+        self.text.config(state='normal')
+        self.text.delete('1.0', 'end')
+        self.text.insert('1.0', self.monitor.report(limit=20))
+        self.text.config(state='disabled')
+
+    def reset(self):
+        self.monitor.reset()
+        self.refresh()
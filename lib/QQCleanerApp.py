@@ -1,40 +1,111 @@
 import os
 import sys
+import time
+import random
 import threading
-import ctypes
 from pathlib import Path
-from ctypes import wintypes
 from datetime import datetime
 from collections import defaultdict
-from tkinter import filedialog, messagebox, ttk, Frame, Label, Scrollbar, Spinbox, StringVar, Menu, W, E, N, S, simpledialog
-from lib.ImportCheck import import_PIL
-from lib.ConfirmationDialog import ConfirmationDialog
-from lib.ThumbnailViewerWindow import ThumbnailViewerWindow
+from tkinter import filedialog, messagebox, ttk, Frame, Label, Scrollbar, Spinbox, StringVar, BooleanVar, Menu, W, E, N, S, simpledialog
+from lib.ImportCheck import preload_modules
+from lib.DeletionPlan import DeletionPlan
+from lib.CacheSources import CACHE_SOURCES, CACHE_SOURCES_BY_KEY
+from lib.ScanSnapshot import EMPTY_SNAPSHOT, freeze_file_data, remove_indexed
+from lib.ShardEstimator import ShardEstimator, initial_sample_size
+from lib.LagMonitor import LagMonitor
 from lib.i18n import I18N_STRINGS
 
-Image, ImageTk = import_PIL()
+# Only what the main window needs is imported above. Pillow and the secondary
+# windows are imported on first use (and warmed up in the background), which
+# keeps the packaged executable quick to show its first window.
+DEFERRED_MODULES = ('PIL.Image', 'PIL.ImageTk', 'lib.ThumbnailViewerWindow', 'lib.ConfirmationDialog', 'lib.RecompressDialog')
+WARM_UP_DELAY_MS = 300
+ESTIMATE_REFRESH_SECONDS = 2.0
 
 class QQCleanerApp:
-    def __init__(self, root):
+    def __init__(self, root, warm_up=True):
         self.root = root
         self.lang = 'zh'  # Default language is Chinese
 
         # --- Data Storage ---
-        self.file_data = defaultdict(lambda: defaultdict(lambda: {'size': 0, 'paths': []}))
+        # Immutable snapshot of the latest scan, replaced as a whole (see ScanSnapshot.py).
+        # One snapshot per bucketing mode; file_data is the one currently shown.
+        self.snapshots = {'mtime': EMPTY_SNAPSHOT, 'content': None}
+        self.file_data = EMPTY_SNAPSHOT
+        # {path: (year, month)} for each snapshot, built along with it off the Tk thread
+        self.month_indexes = {'mtime': {}, 'content': None}
+        # {path: size} of files deleted since the current scan started; a scan that has
+        # already visited a file would otherwise bring it back
+        self.removed_paths = {}
+        # Always names the months the tree shows; while content dates are still being
+        # read it stays on 'mtime' and content_requested is set instead
+        self.bucketing = StringVar(value='mtime')
+        self.content_requested = False
+        # Generation of the scan whose content dates are being read, if any
+        self.content_pass_generation = None
+        # Incremented for every scan; results of a superseded scan are discarded
+        self.scan_generation = 0
+        self.scanning = False
+        # Per-month estimate shown while a quick-estimate scan is still running
+        self.estimate = None
+        self.quick_estimate = BooleanVar(value=True)
+        self.tree_items = {}
         self.root_path = StringVar()
+        self.cache_source = CACHE_SOURCES[0]
+        self.source_key = StringVar(value=self.cache_source.key)
+
+        # Started before the UI is built so that every widget callback is timed
+        self.lag_monitor = LagMonitor(self.root)
+        self.lag_monitor.start()
 
         self.setup_ui()
         self.update_ui_language()
 
-    def _(self, key, *args):
+        if warm_up:
+            # Give Tk a moment to map the window before competing for the GIL
+            self.root.after(WARM_UP_DELAY_MS, self.start_warm_up)
+
+    def start_warm_up(self):
+        """Preload deferred modules in the background after the window appears."""
+        threading.Thread(target=preload_modules, args=(DEFERRED_MODULES,), daemon=True).start()
+
+    def _(self, key, *args, **kwargs):
         """Simple text translation helper."""
-        return I18N_STRINGS[self.lang].get(key, key).format(*args)
+        return I18N_STRINGS[self.lang].get(key, key).format(*args, **kwargs)
 
     def set_language(self, lang_code):
         """Set the application language and update UI."""
         self.lang = lang_code
         self.update_ui_language()
 
+    def show_lag_report(self):
+        """Open the event-loop lag report."""
+        from lib.LagReportWindow import LagReportWindow
+        LagReportWindow(self.root, self, self.lag_monitor)
+
+    def set_cache_source(self):
+        """Switch to the cache type chosen in the menu and reset the current folder."""
+        source = CACHE_SOURCES_BY_KEY[self.source_key.get()]
+        if source is self.cache_source:
+            return
+        self.cache_source = source
+        self.quick_estimate_check.config(state='normal' if source.supports_shard_estimate else 'disabled')
+        self.root_path.set('')
+        self.scan_button.config(state='disabled')
+        self.delete_button.config(state='disabled')
+        self.recompress_button.config(state='disabled')
+        self.scan_generation += 1
+        self.scanning = False
+        self.content_pass_generation = None
+        self.estimate = None
+        self.snapshots = {'mtime': EMPTY_SNAPSHOT, 'content': None}
+        self.file_data = EMPTY_SNAPSHOT
+        self.month_indexes = {'mtime': {}, 'content': None}
+        self.removed_paths = {}
+        self.update_treeview()
+        self.update_ui_language()
+        self.status_label.config(text=self._('status_select_folder'))
+
     def setup_ui(self):
         """Initialize the GUI application."""
         # --- Menu Bar ---
@@ -44,6 +115,14 @@ class QQCleanerApp:
         menubar.add_cascade(label=self._('language_menu'), menu=language_menu)
         language_menu.add_command(label="中文", command=lambda: self.set_language('zh'))
         language_menu.add_command(label="English", command=lambda: self.set_language('en'))
+        self.source_menu = Menu(menubar, tearoff=0)
+        menubar.add_cascade(label=self._('source_menu'), menu=self.source_menu)
+        for source in CACHE_SOURCES:
+            self.source_menu.add_radiobutton(label=self._(source.name_key), value=source.key,
+                                             variable=self.source_key, command=self.set_cache_source)
+        self.diagnostics_menu = Menu(menubar, tearoff=0)
+        menubar.add_cascade(label=self._('diagnostics_menu'), menu=self.diagnostics_menu)
+        self.diagnostics_menu.add_command(label=self._('lag_report_title'), command=self.show_lag_report)
         
         self.root.minsize(600, 450)
 
@@ -60,6 +139,15 @@ class QQCleanerApp:
         self.select_folder_button = ttk.Button(top_frame, command=self.select_folder)
         self.select_folder_button.pack(side='left')
 
+        view_frame = Frame(self.root, padx=10)
+        view_frame.pack(fill='x')
+        self.bucketing_label = Label(view_frame)
+        self.bucketing_label.pack(side='left')
+        self.bucketing_mtime_radio = ttk.Radiobutton(view_frame, variable=self.bucketing, value='mtime', command=self.set_bucketing)
+        self.bucketing_mtime_radio.pack(side='left', padx=5)
+        self.bucketing_content_radio = ttk.Radiobutton(view_frame, variable=self.bucketing, value='content', command=self.set_bucketing)
+        self.bucketing_content_radio.pack(side='left')
+
         mid_frame = Frame(self.root, padx=10, pady=5)
         mid_frame.pack(fill='both', expand=True)
 
@@ -77,6 +165,8 @@ class QQCleanerApp:
 
         self.scan_button = ttk.Button(bottom_frame, command=self.start_scan, state='disabled')
         self.scan_button.pack(side='left')
+        self.quick_estimate_check = ttk.Checkbutton(bottom_frame, variable=self.quick_estimate)
+        self.quick_estimate_check.pack(side='left', padx=(5, 0))
 
         self.delete_label = Label(bottom_frame)
         self.delete_label.pack(side='left', padx=(20, 5))
@@ -90,6 +180,9 @@ class QQCleanerApp:
         self.delete_button = ttk.Button(bottom_frame, command=self.start_delete, state='disabled')
         self.delete_button.pack(side='left', padx=5)
 
+        self.recompress_button = ttk.Button(bottom_frame, command=self.start_recompress, state='disabled')
+        self.recompress_button.pack(side='left')
+
         status_frame = Frame(self.root, padx=10, pady=5, bd=1, relief='sunken')
         status_frame.pack(fill='x', side='bottom')
         self.progress = ttk.Progressbar(status_frame, orient='horizontal', mode='determinate')
@@ -100,14 +193,25 @@ class QQCleanerApp:
     def update_ui_language(self):
         """Update all text elements in the UI to the current language."""
         self.root.title(self._('window_title'))
-        self.root.nametowidget(self.root.cget('menu')).entryconfig(1, label=self._('language_menu'))
+        menubar = self.root.nametowidget(self.root.cget('menu'))
+        menubar.entryconfig(1, label=self._('language_menu'))
+        menubar.entryconfig(2, label=self._('source_menu'))
+        menubar.entryconfig(3, label=self._('diagnostics_menu'))
+        self.diagnostics_menu.entryconfig(0, label=self._('lag_report_title'))
+        for index, source in enumerate(CACHE_SOURCES):
+            self.source_menu.entryconfig(index, label=self._(source.name_key))
         
-        self.folder_label.config(text=self._('folder_label'))
+        self.folder_label.config(text=self._(self.cache_source.folder_label_key))
         self.select_folder_button.config(text=self._('select_folder_btn'))
         self.auto_select_button.config(text=self._('auto_select_folder_btn'))
         self.scan_button.config(text=self._('scan_files_btn'))
+        self.bucketing_label.config(text=self._('bucket_by'))
+        self.bucketing_mtime_radio.config(text=self._('bucket_mtime'))
+        self.bucketing_content_radio.config(text=self._('bucket_content'))
+        self.quick_estimate_check.config(text=self._('quick_estimate_chk'))
         self.delete_label.config(text=self._('delete_prompt'))
         self.delete_button.config(text=self._('delete_files_btn'))
+        self.recompress_button.config(text=self._('recompress_files_btn'))
         
         self.tree.heading('month', text=self._('tree_month'))
         self.tree.heading('size', text=self._('tree_size'))
@@ -117,20 +221,21 @@ class QQCleanerApp:
             self.status_label.config(text=self._('status_select_folder'))
         
         # Redraw treeview with translated strings if data exists
-        if self.file_data:
+        if self.file_data or self.estimate:
             self.update_treeview()
 
 
     def select_folder(self):
         """Open a dialog to select the root folder."""
-        path = filedialog.askdirectory(title="Select the QQ Group folder")
+        path = filedialog.askdirectory(title=self._(self.cache_source.folder_label_key))
         if path:
             self.set_folder_path(path)
 
     def auto_select_folder(self):
-        """Try to automatically find the QQ Group folder."""
-        qq_number = simpledialog.askstring(self._('qq_number_title'), self._('prompt_qq_number'), parent=self.root)
-        if not qq_number or not qq_number.isdigit():
+        """Try to automatically find the cache folder of the selected source."""
+        source = self.cache_source
+        account = simpledialog.askstring(self._(source.account_title_key), self._(source.account_prompt_key), parent=self.root)
+        if not source.validate_account(account):
             return
 
         documents_path = self.get_documents_path()
@@ -138,17 +243,19 @@ class QQCleanerApp:
               messagebox.showwarning(self._('error_find_qq_folder_title'), "Could not determine the Documents folder path.")
               return
 
-        qq_folder_path = Path(documents_path) / 'Tencent Files' / qq_number / 'Image' / 'Group2'
+        folder_path = source.locate(documents_path, account.strip())
 
-        if qq_folder_path.is_dir():
-            self.set_folder_path(str(qq_folder_path))
+        if folder_path:
+            self.set_folder_path(str(folder_path))
         else:
-            messagebox.showwarning(self._('error_find_qq_folder_title'), self._('error_find_qq_folder_msg'))
+            messagebox.showwarning(self._('error_find_qq_folder_title'), self._(source.not_found_msg_key))
 
     def get_documents_path(self):
         """Get the user's Documents folder path reliably on Windows."""
         if sys.platform == 'win32':
-            # These modules are now imported at the top of the file
+            # Imported here rather than at the top to keep startup fast
+            import ctypes
+            from ctypes import wintypes
             CSIDL_PERSONAL = 5       # My Documents
             SHGFP_TYPE_CURRENT = 0   # Get current, not default value
 
@@ -165,7 +272,15 @@ class QQCleanerApp:
         self.status_label.config(text=self._('status_folder_selected', path))
         self.scan_button.config(state='normal')
         self.delete_button.config(state='disabled')
-        self.file_data.clear()
+        self.recompress_button.config(state='disabled')
+        self.scan_generation += 1
+        self.scanning = False
+        self.content_pass_generation = None
+        self.estimate = None
+        self.snapshots = {'mtime': EMPTY_SNAPSHOT, 'content': None}
+        self.file_data = EMPTY_SNAPSHOT
+        self.month_indexes = {'mtime': {}, 'content': None}
+        self.removed_paths = {}
         self.update_treeview()
 
     def start_scan(self):
@@ -174,20 +289,34 @@ class QQCleanerApp:
             messagebox.showerror(self._('error_title'), self._('error_no_folder'))
             return
         
+        # The previous snapshot stays browsable while the new scan runs
         self.scan_button.config(state='disabled')
-        self.delete_button.config(state='disabled')
         self.status_label.config(text=self._('status_scanning'))
         
         # Switch to determinate progress bar
         self.progress.stop()
         self.progress.config(mode='determinate', value=0)
         
-        threading.Thread(target=self.scan_thread, daemon=True).start()
-
-    def scan_thread(self):
-        """Optimized scanning logic using os.scandir."""
-        self.file_data.clear()
-        path_to_scan = self.root_path.get()
+        self.scan_generation += 1
+        self.scanning = True
+        self.content_pass_generation = None # A running pass belongs to the old scan and stops
+        self.removed_paths = {}
+        # Estimated rows cannot be browsed or acted on, so they never replace a previous
+        # result (e.g. the rescan after a deletion); they only fill an empty tree
+        quick_estimate = self.quick_estimate.get() and self.cache_source.supports_shard_estimate and not self.file_data
+        threading.Thread(target=self.scan_thread, args=(self.root_path.get(), self.scan_generation, quick_estimate), daemon=True).start()
+
+    def scan_thread(self, path_to_scan, generation, quick_estimate=False):
+        """Optimized scanning logic using os.scandir.
+
+        With `quick_estimate`, top-level shards are scanned in random order and the
+        per-month totals are extrapolated from the shards done so far: first after a
+        small sample, then every few seconds until the full result replaces them.
+        """
+        # Private to this thread until published as an immutable snapshot
+        file_data = defaultdict(lambda: defaultdict(lambda: {'size': 0, 'paths': []}))
+        month_index = {} # path -> (year, month), sharing one tuple per month
+        month_keys = {}
         
         # --- 关键修复 2: 增强错误捕获和报告 ---
         # 使用更广泛的 except Exception as e 来捕获所有可能的错误
@@ -205,10 +334,18 @@ class QQCleanerApp:
             print(f"!!! REASON: {e}")
             import traceback
             traceback.print_exc() # 打印完整的错误堆栈
-            self.root.after(0, self.finish_scan)
+            self.root.after(0, lambda: self.finish_scan(EMPTY_SNAPSHOT, generation, {}))
             return
 
-        def process_file(entry):
+        estimator = None
+        if quick_estimate and total_entries > 1:
+            # A random order makes every prefix of the scan a random sample of shards
+            random.shuffle(all_entries)
+            estimator = ShardEstimator(total_entries)
+            first_estimate_at = initial_sample_size(total_entries)
+            last_estimate_time = 0.0
+
+        def process_file(entry, shard_totals):
             """Processes a single file entry to avoid code duplication."""
             try:
                 stat = entry.stat()
@@ -219,40 +356,72 @@ class QQCleanerApp:
                 dt_object = datetime.fromtimestamp(file_time)
                 year, month = dt_object.year, dt_object.month
                 
-                self.file_data[year][month]['size'] += file_size
-                self.file_data[year][month]['paths'].append(entry.path)
+                file_data[year][month]['size'] += file_size
+                file_data[year][month]['paths'].append(entry.path)
+                key = (year, month)
+                month_index[entry.path] = month_keys.setdefault(key, key)
+                totals = shard_totals.setdefault((year, month), [0, 0])
+                totals[0] += 1
+                totals[1] += file_size
             except Exception as e:
                 # 如果单个文件处理失败，打印警告但继续运行
                 print(f"--- WARNING: Could not process file '{entry.path}'. Reason: {e}")
                 
-        def recursive_scan(path):
+        def recursive_scan(path, shard_totals):
             try:
                 for entry in os.scandir(path):
                     if entry.is_dir(follow_symlinks=False):
-                        recursive_scan(entry.path)
+                        recursive_scan(entry.path, shard_totals)
                     elif entry.is_file(follow_symlinks=False):
-                        process_file(entry)
+                        process_file(entry, shard_totals)
             except Exception as e:
                 print(f"--- WARNING: Could not scan sub-directory '{path}'. Reason: {e}")
 
         # --- Main Scan Loop ---
         try:
             for i, entry in enumerate(all_entries):
+                if generation != self.scan_generation:
+                    print("Scan superseded by a newer one, stopping.")
+                    break
+                shard_totals = {} # (year, month) -> [count, size] for this top-level entry
                 try:
                     if entry.is_dir(follow_symlinks=False):
-                        recursive_scan(entry.path)
+                        recursive_scan(entry.path, shard_totals)
                     elif entry.is_file(follow_symlinks=False):
-                        process_file(entry)
+                        process_file(entry, shard_totals)
                 finally:
                     # Update progress after processing each top-level entry
                     self.root.after(0, lambda i=i: self.progress.config(value=i + 1))
+
+                if estimator is not None and i + 1 < total_entries:
+                    estimator.add_shard(shard_totals)
+                    now = time.monotonic()
+                    if estimator.sampled >= first_estimate_at and now - last_estimate_time >= ESTIMATE_REFRESH_SECONDS:
+                        last_estimate_time = now
+                        estimate, sampled = estimator.estimate(), estimator.sampled
+                        self.root.after(0, lambda: self.show_estimate(estimate, sampled, total_entries, generation))
         finally:
             print("Scan loop finished.")
+            snapshot = freeze_file_data(file_data)
             # Final call to ensure GUI is updated after the loop finishes
-            self.root.after(0, self.finish_scan)
+            self.root.after(0, lambda: self.finish_scan(snapshot, generation, month_index))
     
-    def finish_scan(self):
-        """Update the GUI after the scan is complete."""
+    def finish_scan(self, snapshot, generation, month_index):
+        """Swap in the new snapshot and update the GUI after the scan is complete."""
+        if generation != self.scan_generation:
+            return # A newer scan (or a folder change) has superseded this one
+        self.scanning = False
+        self.content_pass_generation = None
+        # Files deleted from the viewer while the scan ran may be in the result
+        snapshot = remove_indexed(snapshot, month_index, self.removed_paths)
+        self.month_indexes = {'mtime': month_index, 'content': None}
+        # Content dates are bucketed from this snapshot again; cached dates make that quick.
+        # Until then the tree, the radio buttons, Delete and Recompress all use mtime months.
+        self.content_requested = self.content_requested or self.bucketing.get() == 'content'
+        self.bucketing.set('mtime')
+        self.snapshots = {'mtime': snapshot, 'content': None}
+        self.file_data = snapshot
+        self.estimate = None
         self.progress.stop()
         self.progress['value'] = 0
         self.update_treeview()
@@ -262,23 +431,147 @@ class QQCleanerApp:
         self.scan_button.config(state='normal')
         if self.file_data:
             self.delete_button.config(state='normal')
+            if self.cache_source.supports_recompress:
+                self.recompress_button.config(state='normal')
+            if self.content_requested:
+                self.start_content_pass()
+        else:
+            self.content_requested = False
+
+    def set_bucketing(self):
+        """Switch the tree between mtime and content-date months."""
+        snapshot = self.snapshots.get(self.bucketing.get())
+        if snapshot is None:
+            # Content dates not read yet; keep showing mtime months until they are
+            self.bucketing.set('mtime')
+            self.content_requested = True
+            self.start_content_pass()
+            return
+        self.content_requested = False
+        self.file_data = snapshot
+        if self.estimate is None:
+            self.update_treeview()
+
+    def start_content_pass(self):
+        """Read content dates for the current scan result in the background."""
+        snapshot = self.snapshots['mtime']
+        if not snapshot or self.scanning or self.content_pass_generation == self.scan_generation:
+            return # Nothing scanned yet, a scan is still running (finish_scan starts the pass), or it is already underway
+        self.content_pass_generation = self.scan_generation
+        self.status_label.config(text=self._('status_content_dates', 0, '?'))
+        threading.Thread(target=self.content_date_thread, args=(snapshot, self.root_path.get(), self.scan_generation), daemon=True).start()
+
+    def content_date_thread(self, snapshot, root_path, generation):
+        """Bucket the files of `snapshot` by content date on a worker pool, using the date cache."""
+        from lib.ContentDates import ContentDateCache, resolve_content_dates
+        open_image = self.cache_source.open_image
+
+        total = sum(len(data['paths']) for months in snapshot.values() for data in months.values())
+        self.root.after(0, lambda: self.progress.config(maximum=total if total > 0 else 1, value=0))
+        def on_progress(done):
+            self.root.after(0, lambda: self.update_content_progress(done, total, generation))
+
+        file_data = defaultdict(lambda: defaultdict(lambda: {'size': 0, 'paths': []}))
+        month_index = {}
+        month_keys = {}
+        try:
+            cache = ContentDateCache()
+            try:
+                cached = cache.load(root_path)
+                paths = (path for months in snapshot.values() for data in months.values() for path in data['paths'])
+                for path, size, content_time in resolve_content_dates(paths, cache, cached, open_image, on_progress):
+                    if generation != self.scan_generation:
+                        break
+                    dt_object = datetime.fromtimestamp(content_time)
+                    file_data[dt_object.year][dt_object.month]['size'] += size
+                    file_data[dt_object.year][dt_object.month]['paths'].append(path)
+                    key = (dt_object.year, dt_object.month)
+                    month_index[path] = month_keys.setdefault(key, key)
+            finally:
+                cache.close()
+        except Exception as e:
+            print(f"!!! ERROR: Could not read content dates. Reason: {e}")
+            import traceback
+            traceback.print_exc()
+            self.root.after(0, lambda: self.finish_content_pass(None, generation, None))
+            return
+
+        content = freeze_file_data(file_data)
+        self.root.after(0, lambda: self.finish_content_pass(content, generation, month_index))
+
+    def update_content_progress(self, done, total, generation):
+        if generation != self.scan_generation:
+            return
+        self.progress['value'] = done
+        self.status_label.config(text=self._('status_content_dates', done, total))
+
+    def finish_content_pass(self, content, generation, month_index):
+        """Store the content-date snapshot and show it if it was asked for meanwhile."""
+        if generation != self.scan_generation:
+            return
+        self.content_pass_generation = None
+        self.progress['value'] = 0
+        if content is None:
+            self.content_requested = False
+            self.status_label.config(text=self._('status_content_dates_failed'))
+            return
+        # The pass started from the mtime snapshot of that moment; drop files deleted since
+        content = remove_indexed(content, month_index, self.removed_paths)
+        self.snapshots['content'] = content
+        self.month_indexes['content'] = month_index
+        self.status_label.config(text=self._('status_content_dates_done', sum(len(m) for m in content.values())))
+        if self.content_requested:
+            self.content_requested = False
+            self.bucketing.set('content')
+            self.file_data = content
+            self.update_treeview()
+
+    def show_estimate(self, estimate, sampled, total, generation):
+        """Show extrapolated per-month totals until the full scan result arrives."""
+        if generation != self.scan_generation:
+            return
+        self.estimate = estimate
+        self.update_treeview()
+        self.status_label.config(text=self._('status_estimating', sampled, total))
 
     def update_treeview(self):
         """Clear and repopulate the treeview with the latest file data."""
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self.tree_items = {} # (year, month) -> item id, and year -> year node id
 
-        sorted_years = sorted(self.file_data.keys(), reverse=True)
+        if self.estimate is not None:
+            self.populate_estimate()
+            return
+
+        file_data = self.file_data # Read a single snapshot for the whole redraw
+        sorted_years = sorted(file_data.keys(), reverse=True)
         for year in sorted_years:
             year_node = self.tree.insert('', 'end', values=(self._('year_prefix', year), "", ""), open=True)
-            sorted_months = sorted(self.file_data[year].keys(), reverse=True)
+            self.tree_items[year] = year_node
+            sorted_months = sorted(file_data[year].keys(), reverse=True)
             for month in sorted_months:
-                data = self.file_data[year][month]
-                size_mb = round(data['size'] / (1024 * 1024), 2)
-                file_count = len(data['paths'])
                 # Store year and month in the item's tags for later retrieval
-                item_id = self.tree.insert(year_node, 'end', values=(f"  └ {month:02d}", f"{size_mb:,.2f}", f"{file_count:,}"))
+                item_id = self.tree.insert(year_node, 'end', values=self.month_row_values(month, file_data[year][month]))
                 self.tree.item(item_id, tags=(str(year), str(month)))
+                self.tree_items[(year, month)] = item_id
+
+    def month_row_values(self, month, data):
+        size_mb = round(data['size'] / (1024 * 1024), 2)
+        file_count = len(data['paths'])
+        return (f"  └ {month:02d}", f"{size_mb:,.2f}", f"{file_count:,}")
+
+    def populate_estimate(self):
+        """Fill the treeview with estimated totals as "≈ value ± 95% half-width"."""
+        estimate = self.estimate
+        for year in sorted(estimate.keys(), reverse=True):
+            year_node = self.tree.insert('', 'end', values=(self._('year_prefix', year), "", ""), open=True)
+            for month in sorted(estimate[year].keys(), reverse=True):
+                data = estimate[year][month]
+                size = f"≈ {data['size'] / (1024 * 1024):,.2f} ± {data['size_ci'] / (1024 * 1024):,.2f}"
+                count = f"≈ {data['count']:,.0f} ± {data['count_ci']:,.0f}"
+                # Estimated rows have no paths behind them, so they are not tagged with year/month
+                self.tree.insert(year_node, 'end', values=(f"  └ {month:02d}", size, count), tags=('estimate',))
 
     def on_tree_double_click(self, event):
         """Handle double-click event on the treeview to open thumbnail viewer."""
@@ -293,55 +586,84 @@ class QQCleanerApp:
                 year, month = int(tags[0]), int(tags[1])
                 paths = self.file_data.get(year, {}).get(month, {}).get('paths', [])
                 if paths:
+                    from lib.ThumbnailViewerWindow import ThumbnailViewerWindow
                     ThumbnailViewerWindow(self.root, self, paths, year, month)
             except (ValueError, IndexError):
                 print(f"Could not parse year/month from tags: {tags}")
 
-    def start_delete(self):
-        """Confirm and start the deletion process."""
+    def remove_paths(self, removed_sizes):
+        """Publish new snapshots without files ({path: size}) deleted outside a full scan (e.g. from the viewer)."""
+        self.removed_paths.update(removed_sizes) # For a scan that is still running
+        shown_index = {}
+        for mode, snapshot in self.snapshots.items():
+            if snapshot is None:
+                continue
+            # Only the months of the removed paths are rebuilt, found through the index
+            new_snapshot = remove_indexed(snapshot, self.month_indexes[mode], removed_sizes)
+            self.snapshots[mode] = new_snapshot
+            if snapshot is self.file_data:
+                self.file_data = new_snapshot
+                shown_index = self.month_indexes[mode]
+        if self.estimate is not None:
+            return # The tree shows a running estimate; finish_scan removes these files from the result
+
+        # Update just the affected rows instead of redrawing the whole tree
+        for year, month in {shown_index[path] for path in removed_sizes if path in shown_index}:
+            item_id = self.tree_items.get((year, month))
+            if item_id is None or not self.tree.exists(item_id):
+                self.update_treeview()
+                return
+            data = self.file_data.get(year, {}).get(month)
+            if data is not None:
+                self.tree.item(item_id, values=self.month_row_values(month, data))
+                continue
+            self.tree.delete(item_id)
+            del self.tree_items[(year, month)]
+            if year not in self.file_data and year in self.tree_items:
+                self.tree.delete(self.tree_items.pop(year))
+
+    def get_selected_plan(self):
+        """Build a DeletionPlan for the year/month chosen in the spinboxes, or None."""
         try:
             target_year = int(self.year_spinbox.get())
             target_month = int(self.month_spinbox.get())
         except ValueError:
             messagebox.showerror(self._('error_title'), self._('error_invalid_date'))
-            return
+            return None
 
-        paths_to_delete = []
-        image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
-        image_paths_to_preview = []
-        
-        for year, months in self.file_data.items():
-            for month, data in months.items():
-                if year < target_year or (year == target_year and month <= target_month):
-                    paths_to_delete.extend(data['paths'])
-                    # Collect image paths for preview
-                    for path in data['paths']:
-                        if path.lower().endswith(image_extensions):
-                            image_paths_to_preview.append(path)
-        
-        if not paths_to_delete:
+        plan = DeletionPlan(self.file_data, target_year, target_month)
+        if not plan:
             self.status_label.config(text="No files to delete for the selected period.")
+            return None
+        return plan
+
+    def start_delete(self):
+        """Confirm and start the deletion process."""
+        plan = self.get_selected_plan()
+        if not plan:
             return
 
-        dialog = ConfirmationDialog(self.root, self, target_year, target_month, image_paths_to_preview)
+        from lib.ConfirmationDialog import ConfirmationDialog
+        dialog = ConfirmationDialog(self.root, self, plan.target_year, plan.target_month, plan)
         self.root.wait_window(dialog.top)
 
         if dialog.confirmed:
             self.scan_button.config(state='disabled')
             self.delete_button.config(state='disabled')
-            self.status_label.config(text=self._('status_deleting', '0', len(paths_to_delete)))
-            threading.Thread(target=self.delete_thread, args=(paths_to_delete,), daemon=True).start()
+            self.recompress_button.config(state='disabled')
+            self.status_label.config(text=self._('status_deleting', '0', plan.count))
+            threading.Thread(target=self.delete_thread, args=(plan,), daemon=True).start()
         else:
             self.status_label.config(text=self._('status_deletion_cancelled'))
 
-    def delete_thread(self, paths_to_delete):
+    def delete_thread(self, plan):
         """The actual deletion logic that runs in the background."""
-        total_files = len(paths_to_delete)
+        total_files = plan.count
         deleted_count, error_count = 0, 0
         
         self.root.after(0, lambda: self.progress.config(maximum=total_files, value=0))
 
-        for i, path in enumerate(paths_to_delete):
+        for i, path in enumerate(plan.iter_paths()):
             try:
                 os.remove(path)
                 deleted_count += 1
@@ -363,3 +685,59 @@ class QQCleanerApp:
         self.status_label.config(text=self._('status_delete_complete', deleted_count, error_count))
         self.progress['value'] = 0
         self.start_scan()
+
+    def start_recompress(self):
+        """Ask for recompression settings and re-encode the selected months in place."""
+        plan = self.get_selected_plan()
+        if not plan:
+            return
+
+        from lib.RecompressDialog import RecompressDialog
+        dialog = RecompressDialog(self.root, self, plan.target_year, plan.target_month, plan)
+        self.root.wait_window(dialog.top)
+
+        if dialog.confirmed:
+            self.scan_button.config(state='disabled')
+            self.delete_button.config(state='disabled')
+            self.recompress_button.config(state='disabled')
+            self.status_label.config(text=self._('status_recompressing', 0, plan.count, '0.00', '0.0', '0.00'))
+            self.progress.config(maximum=plan.count, value=0)
+            threading.Thread(target=self.recompress_thread, args=(plan, dialog.settings), daemon=True).start()
+        else:
+            self.status_label.config(text=self._('status_recompress_cancelled'))
+
+    def recompress_thread(self, plan, settings):
+        """Feed the plan to the recompression process pool and report progress."""
+        from lib.Recompressor import recompress_paths
+        try:
+            stats = recompress_paths(
+                plan.iter_paths(), plan.count,
+                lambda stats: self.root.after(0, lambda: self.update_recompress_progress(stats)),
+                **settings
+            )
+        except Exception as e:
+            print(f"!!! ERROR: Recompression stopped. Reason: {e}")
+            import traceback
+            traceback.print_exc()
+            stats = None
+        self.root.after(0, lambda: self.finish_recompress(stats))
+
+    def update_recompress_progress(self, stats):
+        self.progress['value'] = stats.processed
+        self.status_label.config(text=self._(
+            'status_recompressing', stats.processed, stats.total_files,
+            f"{stats.bytes_saved / (1024 * 1024):,.2f}", f"{stats.files_per_second:,.1f}", f"{stats.mb_per_second:,.2f}"
+        ))
+
+    def finish_recompress(self, stats):
+        """Update the GUI after recompression is complete."""
+        self.progress['value'] = 0
+        if stats is None:
+            self.status_label.config(text=self._('status_recompress_failed'))
+        else:
+            self.status_label.config(text=self._(
+                'status_recompress_complete', stats.saved_files, stats.skipped_files, stats.failed_files,
+                f"{stats.bytes_saved / (1024 * 1024):,.2f}", f"{stats.elapsed:,.1f}"
+            ))
+        # Timestamps are preserved, so a rescan keeps files in the same months with their new sizes
+        self.start_scan()
@@ -0,0 +1,70 @@
+from tkinter import ttk, Frame, Label, Spinbox, Toplevel, W
+from lib.Recompressor import DEFAULT_QUALITY, DEFAULT_MAX_SIDE, DEFAULT_MIN_SAVING
+
+class RecompressDialog:
+    """A dialog to confirm recompression and choose its quality settings."""
+    def __init__(self, parent, app, year, month, plan):
+        self.parent = parent
+        self.app = app
+        self.confirmed = False
+        self.settings = None
+
+        self.top = Toplevel(parent)
+        self.top.title(self.app._('recompress_title'))
+        self.top.transient(parent)
+        self.top.grab_set()
+        self.top.resizable(False, False)
+
+        summary = self.app._('confirm_delete_summary', f"{plan.count:,}", f"{plan.size / (1024 * 1024):,.2f}")
+        Label(self.top, text=summary, justify='left', padx=10).pack(pady=(10, 0))
+        Label(self.top, text=self.app._('recompress_msg', year, month), justify='left', padx=10).pack(pady=(0, 10))
+
+        # Settings
+        settings_frame = Frame(self.top, padx=10)
+        settings_frame.pack(fill='x')
+
+        Label(settings_frame, text=self.app._('recompress_quality')).grid(row=0, column=0, sticky=W, pady=2)
+        self.quality_spinbox = Spinbox(settings_frame, from_=10, to=95, width=6)
+        self.quality_spinbox.grid(row=0, column=1, sticky=W)
+
+        Label(settings_frame, text=self.app._('recompress_max_side')).grid(row=1, column=0, sticky=W, pady=2)
+        self.max_side_spinbox = Spinbox(settings_frame, from_=0, to=16384, increment=256, width=6)
+        self.max_side_spinbox.grid(row=1, column=1, sticky=W)
+
+        Label(settings_frame, text=self.app._('recompress_min_saving')).grid(row=2, column=0, sticky=W, pady=2)
+        self.min_saving_spinbox = Spinbox(settings_frame, from_=0, to=90, width=6)
+        self.min_saving_spinbox.grid(row=2, column=1, sticky=W)
+
+        for spinbox, value in ((self.quality_spinbox, DEFAULT_QUALITY),
+                               (self.max_side_spinbox, DEFAULT_MAX_SIDE),
+                               (self.min_saving_spinbox, int(DEFAULT_MIN_SAVING * 100))):
+            spinbox.delete(0, 'end'); spinbox.insert(0, str(value))
+
+        self.error_label = Label(self.top, text="", fg='red', padx=10)
+        self.error_label.pack()
+
+        # Buttons
+        button_frame = Frame(self.top, pady=5)
+        button_frame.pack()
+        ttk.Button(button_frame, text=self.app._('cancel_btn'), command=self.cancel).pack(side='right', padx=10)
+        ttk.Button(button_frame, text=self.app._('recompress_confirm_btn'), command=self.confirm).pack(side='right')
+
+    def confirm(self):
+        try:
+            quality = int(self.quality_spinbox.get())
+            max_side = int(self.max_side_spinbox.get())
+            min_saving = int(self.min_saving_spinbox.get())
+        except ValueError:
+            self.error_label.config(text=self.app._('error_invalid_settings'))
+            return
+        if not (10 <= quality <= 95) or max_side < 0 or not (0 <= min_saving < 100):
+            self.error_label.config(text=self.app._('error_invalid_settings'))
+            return
+
+        self.settings = {'quality': quality, 'max_side': max_side, 'min_saving': min_saving / 100}
+        self.confirmed = True
+        self.top.destroy()
+
+    def cancel(self):
+        self.confirmed = False
+        self.top.destroy()
@@ -0,0 +1,165 @@
+import os
+import io
+import time
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+# Outcome of recompressing a single file
+RESULT_SAVED = 'saved'
+RESULT_SKIPPED = 'skipped'
+RESULT_FAILED = 'failed'
+
+DEFAULT_QUALITY = 80
+DEFAULT_MAX_SIDE = 0        # 0 keeps the original resolution
+DEFAULT_MIN_SAVING = 0.10   # Keep the original unless the result is at least 10% smaller
+
+def _has_alpha(image):
+    # 'transparency' covers palette images and the tRNS colour key of L/RGB PNGs
+    return image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+
+def encode_image(path, quality=DEFAULT_QUALITY, max_side=DEFAULT_MAX_SIDE):
+    """Re-encode one image and return the new bytes, or None if the format is left alone.
+
+    JPEGs are re-encoded at `quality`; opaque PNG/BMP screenshots become JPEGs and
+    transparent ones become optimized PNGs. Animated images are never touched.
+    EXIF and ICC data are carried over so the picture keeps its metadata.
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        image = Image.open(path)
+    except UnidentifiedImageError:
+        return None # Not an image (or not one Pillow understands)
+
+    with image:
+        if getattr(image, 'n_frames', 1) > 1 or image.format not in ('JPEG', 'PNG', 'BMP'):
+            return None
+
+        image.load()
+        if max_side and max(image.size) > max_side:
+            image.thumbnail((max_side, max_side), Image.LANCZOS)
+
+        extra = {}
+        if image.info.get('exif'):
+            extra['exif'] = image.info['exif']
+        if image.info.get('icc_profile'):
+            extra['icc_profile'] = image.info['icc_profile']
+
+        buffer = io.BytesIO()
+        if _has_alpha(image):
+            # JPEG cannot hold transparency, so stay lossless
+            image.save(buffer, 'PNG', optimize=True, **extra)
+        else:
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+                # The profile describes the old colour space (e.g. CMYK) and would now be wrong
+                extra.pop('icc_profile', None)
+            image.save(buffer, 'JPEG', quality=quality, optimize=True, **extra)
+        return buffer.getvalue()
+
+def recompress_file(path, quality=DEFAULT_QUALITY, max_side=DEFAULT_MAX_SIDE, min_saving=DEFAULT_MIN_SAVING):
+    """Recompress one file in place. Runs inside a worker process.
+
+    The result is written to a temporary file in the same folder and atomically
+    swapped in. The original permissions and timestamps are restored, the latter so
+    the file stays in the same month bucket. Returns (path, status, old_size, new_size).
+    """
+    try:
+        stat = os.stat(path)
+        old_size = stat.st_size
+        data = encode_image(path, quality, max_side)
+        if data is None or len(data) > old_size * (1 - min_saving):
+            return path, RESULT_SKIPPED, old_size, old_size
+
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.recompress-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file as 0600; keep the original permissions
+            os.chmod(temp_path, stat.st_mode & 0o7777)
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return path, RESULT_SAVED, old_size, len(data)
+    except Exception as e:
+        print(f"--- WARNING: Could not recompress '{path}'. Reason: {e}")
+        return path, RESULT_FAILED, 0, 0
+
+class RecompressStats:
+    """Running totals for a recompression job."""
+    def __init__(self, total_files):
+        self.total_files = total_files
+        self.processed = 0
+        self.saved_files = 0
+        self.skipped_files = 0
+        self.failed_files = 0
+        self.bytes_in = 0
+        self.bytes_saved = 0
+        self.start_time = time.monotonic()
+
+    def add(self, status, old_size, new_size):
+        self.processed += 1
+        self.bytes_in += old_size
+        if status == RESULT_SAVED:
+            self.saved_files += 1
+            self.bytes_saved += old_size - new_size
+        elif status == RESULT_SKIPPED:
+            self.skipped_files += 1
+        else:
+            self.failed_files += 1
+
+    @property
+    def elapsed(self):
+        return max(time.monotonic() - self.start_time, 1e-6)
+
+    @property
+    def files_per_second(self):
+        return self.processed / self.elapsed
+
+    @property
+    def mb_per_second(self):
+        return self.bytes_in / (1024 * 1024) / self.elapsed
+
+def recompress_paths(paths, total_files, on_progress, quality=DEFAULT_QUALITY, max_side=DEFAULT_MAX_SIDE,
+                     min_saving=DEFAULT_MIN_SAVING, max_workers=None, report_interval=0.5):
+    """Recompress `paths` on a process pool, calling on_progress(stats) periodically.
+
+    Paths are consumed lazily and only a bounded number of tasks is in flight at a
+    time, so memory use does not grow with the size of the selection.
+    """
+    stats = RecompressStats(total_files)
+    max_workers = max_workers or os.cpu_count() or 1
+    max_in_flight = max_workers * 4
+    last_report = 0.0
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        path_iter = iter(paths)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_in_flight:
+                path = next(path_iter, None)
+                if path is None:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(recompress_file, path, quality, max_side, min_saving))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                _, status, old_size, new_size = future.result()
+                stats.add(status, old_size, new_size)
+
+            now = time.monotonic()
+            if now - last_report >= report_interval:
+                last_report = now
+                on_progress(stats)
+
+    on_progress(stats)
+    return stats
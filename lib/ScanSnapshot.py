@@ -0,0 +1,64 @@
+from types import MappingProxyType
+from collections import defaultdict
+
+# Scan results are published to the UI as immutable snapshots:
+#     {year: {month: {'size': int, 'paths': tuple}}}
+# built from read-only mappings and tuples. The UI only ever swaps the whole
+# snapshot reference, so readers on any thread can keep using the snapshot they
+# hold without locks while a new scan or a deletion builds the next one.
+
+EMPTY_SNAPSHOT = MappingProxyType({})
+
+def freeze_month(size, paths):
+    return MappingProxyType({'size': size, 'paths': tuple(paths)})
+
+def freeze_file_data(file_data):
+    """Turn a scan worker's private mutable result into an immutable snapshot."""
+    return MappingProxyType({
+        year: MappingProxyType({
+            month: freeze_month(data['size'], data['paths'])
+            for month, data in months.items()
+        })
+        for year, months in file_data.items()
+    })
+
+def remove_from_snapshot(snapshot, year, month, removed_sizes):
+    """Return a new snapshot with the paths in `removed_sizes` ({path: size}) taken out of one month.
+
+    Only the affected month and year are rebuilt; every other month is shared with
+    the old snapshot, which stays valid for anyone still reading it.
+    """
+    months = snapshot.get(year, {})
+    data = months.get(month)
+    if data is None:
+        return snapshot
+
+    remaining = [path for path in data['paths'] if path not in removed_sizes]
+    removed_size = sum(removed_sizes[path] for path in data['paths'] if path in removed_sizes)
+
+    new_months = dict(months)
+    if remaining:
+        new_months[month] = freeze_month(max(data['size'] - removed_size, 0), remaining)
+    else:
+        del new_months[month]
+
+    new_snapshot = dict(snapshot)
+    if new_months:
+        new_snapshot[year] = MappingProxyType(new_months)
+    else:
+        del new_snapshot[year]
+    return MappingProxyType(new_snapshot)
+
+def remove_indexed(snapshot, month_index, removed_sizes):
+    """Like remove_from_snapshot for paths of any month, looked up in `month_index` ({path: (year, month)}).
+
+    Paths missing from the index are not part of the snapshot and are ignored.
+    """
+    by_month = defaultdict(dict)
+    for path, size in removed_sizes.items():
+        key = month_index.get(path)
+        if key is not None:
+            by_month[key][path] = size
+    for (year, month), sizes in by_month.items():
+        snapshot = remove_from_snapshot(snapshot, year, month, sizes)
+    return snapshot
@@ -0,0 +1,58 @@
+import math
+from collections import defaultdict
+
+# Group2 spreads files fairly evenly over its hashed top-level folders ("shards").
+# Scanning shards in random order makes every prefix of the scan a simple random
+# sample, so per-month totals can be extrapolated at any point with a confidence
+# interval that narrows as more shards are scanned.
+
+Z_95 = 1.96
+MIN_SAMPLE_SHARDS = 8
+SAMPLE_FRACTION = 0.05
+
+def initial_sample_size(total_shards):
+    """Number of shards to scan before the first estimate is shown."""
+    return min(total_shards, max(MIN_SAMPLE_SHARDS, math.ceil(total_shards * SAMPLE_FRACTION)))
+
+class ShardEstimator:
+    """Extrapolates per-month file counts and bytes from a random sample of shards."""
+    def __init__(self, total_shards):
+        self.total_shards = total_shards
+        self.shards = [] # One {(year, month): [count, size]} per scanned shard
+
+    @property
+    def sampled(self):
+        return len(self.shards)
+
+    def add_shard(self, month_totals):
+        self.shards.append(month_totals)
+
+    def _extrapolate(self, values, z):
+        """Return (estimated total, confidence half-width) for one month's per-shard values."""
+        n, N = len(values), self.total_shards
+        mean = sum(values) / n
+        if n < 2 or n >= N:
+            return N * mean, 0.0
+        variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+        # Standard error of the total, with the finite population correction
+        standard_error = N * math.sqrt(variance / n) * math.sqrt(1 - n / N)
+        return N * mean, z * standard_error
+
+    def estimate(self, z=Z_95):
+        """Return {year: {month: {'count', 'count_ci', 'size', 'size_ci'}}} for the shards so far."""
+        if not self.shards:
+            return {}
+
+        months = set()
+        for shard in self.shards:
+            months.update(shard)
+
+        result = defaultdict(dict)
+        for key in months:
+            counts = [shard[key][0] if key in shard else 0 for shard in self.shards]
+            sizes = [shard[key][1] if key in shard else 0 for shard in self.shards]
+            count, count_ci = self._extrapolate(counts, z)
+            size, size_ci = self._extrapolate(sizes, z)
+            year, month = key
+            result[year][month] = {'count': count, 'count_ci': count_ci, 'size': size, 'size_ci': size_ci}
+        return dict(result)
@@ -4,8 +4,10 @@ import threading
 from tkinter import messagebox, ttk, Frame, Label, Scrollbar, StringVar, Canvas, Menu, Toplevel
 from lib.ToolTip import ToolTip
 from lib.ImportCheck import import_PIL
+from lib.IndexedImageList import IndexedImageList
 
-Image, ImageTk = import_PIL()
+SELECTED_COLOR = '#3399ff'
+DRAG_THRESHOLD = 4 # Pixels the mouse must move before a press becomes a rubber-band drag
 
 class ThumbnailViewerWindow:
     def __init__(self, parent, app, image_paths, year, month):
@@ -13,6 +15,7 @@ class ThumbnailViewerWindow:
         self.app = app
         self.year = year
         self.month = month
+        import_PIL() # Pillow is loaded on first use rather than at startup
         
         self.top = Toplevel(parent)
         self.top.title(self.app._('thumb_viewer_title', self.year, self.month))
@@ -20,9 +23,14 @@ class ThumbnailViewerWindow:
         self.top.transient(parent)
         self.top.grab_set()
 
-        self.all_images = [] # Will store tuples of (path, size, mtime)
-        self.photo_references = {} # path -> PhotoImage
+        self.all_images = IndexedImageList() # Records of {'path', 'size', 'time'}
+        self.photo_references = {} # path -> PhotoImage (None if it could not be loaded)
         self.thumb_labels = {} # path -> Label widget
+        self.selected = set() # Selected paths, across all pages
+        self.selected_size = 0 # Total bytes of the selection, kept up to date as it changes
+        self.selection_anchor = None # Last plainly clicked path, for shift-click ranges
+        self.drag = None # Rubber-band state while the left button is held
+        self.deleting = False
         
         self.current_page = 1
         self.items_per_page = StringVar(value='20')
@@ -61,6 +69,16 @@ class ThumbnailViewerWindow:
         self.prev_button = ttk.Button(control_frame, text=self.app._('prev_page'), command=lambda: self.change_page(-1))
         self.prev_button.pack(side='right', padx=5)
 
+        # --- Selection Frame ---
+        selection_frame = Frame(self.top, padx=10)
+        selection_frame.pack(fill='x')
+        ttk.Button(selection_frame, text=self.app._('select_all'), command=self.select_all).pack(side='left')
+        ttk.Button(selection_frame, text=self.app._('select_none'), command=self.clear_selection).pack(side='left', padx=5)
+        self.delete_selected_button = ttk.Button(selection_frame, text=self.app._('delete_selected'), command=self.delete_selected, state='disabled')
+        self.delete_selected_button.pack(side='left')
+        self.selection_label = Label(selection_frame, text="")
+        self.selection_label.pack(side='left', padx=10)
+
         # --- Main Content (Canvas for thumbnails) ---
         main_frame = Frame(self.top, bd=1, relief='sunken')
         main_frame.pack(fill='both', expand=True, padx=10, pady=5)
@@ -78,12 +96,19 @@ class ThumbnailViewerWindow:
         # --- Mouse Wheel Scrolling ---
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
 
+        # --- Selection: click, ctrl/shift-click, rubber band and keyboard ---
+        for widget in (self.canvas, self.scrollable_frame):
+            self._bind_selection_events(widget, None)
+        self.top.bind('<Control-a>', lambda e: self.select_all())
+        self.top.bind('<Delete>', lambda e: self.delete_selected())
+        self.top.bind('<Escape>', lambda e: self.clear_selection())
+
         # --- Resize Handling ---
         self.top.bind('<Configure>', self.on_resize)
 
         # --- Context Menu ---
         self.context_menu = Menu(self.top, tearoff=0)
-        self.context_menu.add_command(label=self.app._('context_delete'), command=self.delete_image)
+        self.context_menu.add_command(label=self.app._('context_delete'), command=self.delete_clicked)
         self.context_menu.add_command(label=self.app._('context_open'), command=self.open_image)
         self.context_menu.add_command(label=self.app._('context_open_dir'), command=self.open_image_directory)
         self.clicked_image_path = None
@@ -122,7 +147,7 @@ class ThumbnailViewerWindow:
                 temp_list.append({'path': path, 'size': stat.st_size, 'time': stat.st_mtime})
             except FileNotFoundError:
                 continue
-        self.all_images = temp_list
+        self.all_images = IndexedImageList(temp_list)
         self.top.after(0, self.sort_and_update)
 
     def sort_and_update(self, event=None):
@@ -159,31 +184,35 @@ class ThumbnailViewerWindow:
         self.total_pages = (total_items + per_page - 1) // per_page
         if self.total_pages == 0: self.total_pages = 1
 
+        self.current_page = min(self.current_page, self.total_pages)
         start_index = (self.current_page - 1) * per_page
         end_index = start_index + per_page
-        self.images_on_page = self.all_images[start_index:end_index]
+        self.images_on_page = self.all_images.slice(start_index, end_index)
 
         self.update_page_controls()
         
         if self.images_on_page:
-            if force_reload:
+            # Pages shifted by a deletion may contain images whose thumbnails are not loaded yet
+            if force_reload or any(img['path'] not in self.photo_references for img in self.images_on_page):
                 threading.Thread(target=self._load_thumbnails_thread, args=(self.images_on_page,), daemon=True).start()
             else:
                 self.populate_thumbnails(self.images_on_page)
 
     def _load_thumbnails_thread(self, image_data):
         """Load thumbnail images in the background."""
+        _, ImageTk = import_PIL()
         for data in image_data:
             path = data['path']
             if path in self.photo_references:
                 continue
             try:
-                image = Image.open(path)
+                image = self.app.cache_source.open_image(path)
                 image.thumbnail((150, 150))
                 photo = ImageTk.PhotoImage(image)
                 self.photo_references[path] = photo
             except Exception as e:
                 print(f"Error loading thumbnail for {path}: {e}")
+                self.photo_references[path] = None # Don't retry on every reflow
         
         self.top.after(0, lambda: self.populate_thumbnails(image_data))
 
@@ -191,6 +220,7 @@ class ThumbnailViewerWindow:
         """Place loaded thumbnails onto the canvas in a fixed grid."""
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
+        self.thumb_labels.clear()
 
         for i, data in enumerate(image_data):
             path = data['path']
@@ -207,8 +237,10 @@ class ThumbnailViewerWindow:
             label = Label(frame, image=photo)
             label.pack(expand=True)
             self.thumb_labels[path] = label
+            self._paint_selection(path)
 
             label.bind("<Button-3>", lambda e, p=path: self.show_context_menu(e, p))
+            self._bind_selection_events(label, path)
             ToolTip(label, os.path.basename(path))
 
         for col_index in range(self.columns):
@@ -219,6 +251,97 @@ class ThumbnailViewerWindow:
         self.page_label.config(text=self.app._('page_label', self.current_page, self.total_pages))
         self.prev_button.config(state='normal' if self.current_page > 1 else 'disabled')
         self.next_button.config(state='normal' if self.current_page < self.total_pages else 'disabled')
+        self.update_selection_controls()
+
+    # --- Selection ---
+    def _bind_selection_events(self, widget, path):
+        widget.bind("<ButtonPress-1>", lambda e: self.on_press(e, path))
+        widget.bind("<B1-Motion>", self.on_drag)
+        widget.bind("<ButtonRelease-1>", self.on_release)
+
+    def _paint_selection(self, path):
+        label = self.thumb_labels.get(path)
+        if label is not None:
+            label.master.config(bg=SELECTED_COLOR if path in self.selected else self.scrollable_frame.cget('bg'))
+
+    def _set_selection(self, paths):
+        """Replace the selection, repainting only thumbnails whose state changed."""
+        paths = set(paths)
+        changed = self.selected ^ paths
+        self.selected = paths
+        for path in changed:
+            self._paint_selection(path)
+            record = self.all_images.get(path)
+            if record is not None:
+                self.selected_size += record['size'] if path in paths else -record['size']
+        self.update_selection_controls()
+
+    def update_selection_controls(self):
+        count = len(self.selected)
+        size = self.selected_size
+        self.selection_label.config(text=self.app._('selection_label', count, f"{size / (1024 * 1024):,.2f}") if count else "")
+        self.delete_selected_button.config(state='normal' if count and not self.deleting else 'disabled')
+
+    def select_all(self):
+        self._set_selection(record['path'] for record in self.all_images)
+
+    def clear_selection(self):
+        self._set_selection(())
+
+    def on_press(self, event, path):
+        """Plain click selects one image, Ctrl toggles it, Shift extends from the anchor."""
+        ctrl = bool(event.state & 0x0004)
+        shift = bool(event.state & 0x0001)
+        self.drag = {'x': event.x_root, 'y': event.y_root, 'band': None,
+                     'base': set(self.selected) if ctrl or shift else set()}
+
+        if path is None:
+            if not ctrl and not shift:
+                self.clear_selection()
+        elif shift and self.selection_anchor in self.all_images:
+            self._set_selection(self.drag['base'] | set(self.all_images.paths_between(self.selection_anchor, path)))
+        elif ctrl:
+            self._set_selection(self.selected ^ {path})
+            self.selection_anchor = path
+        else:
+            self._set_selection((path,))
+            self.selection_anchor = path
+
+    def on_drag(self, event):
+        """Draw a rubber band and select the thumbnails on this page that it touches."""
+        if self.drag is None:
+            return
+        if self.drag['band'] is None:
+            if abs(event.x_root - self.drag['x']) < DRAG_THRESHOLD and abs(event.y_root - self.drag['y']) < DRAG_THRESHOLD:
+                return
+            # Canvas items can't be drawn over embedded widgets, so the band is four thin frames
+            self.drag['band'] = [Frame(self.scrollable_frame, bg=SELECTED_COLOR) for _ in range(4)]
+
+        origin_x, origin_y = self.scrollable_frame.winfo_rootx(), self.scrollable_frame.winfo_rooty()
+        x1, x2 = sorted((self.drag['x'] - origin_x, event.x_root - origin_x))
+        y1, y2 = sorted((self.drag['y'] - origin_y, event.y_root - origin_y))
+
+        top, bottom, left, right = self.drag['band']
+        for edge, geometry in ((top, (x1, y1, x2 - x1, 1)), (bottom, (x1, y2, x2 - x1, 1)),
+                               (left, (x1, y1, 1, y2 - y1)), (right, (x2, y1, 1, y2 - y1 + 1))):
+            if edge.winfo_exists():
+                edge.place(x=geometry[0], y=geometry[1], width=max(geometry[2], 1), height=max(geometry[3], 1))
+                edge.lift()
+
+        touched = set()
+        for path, label in self.thumb_labels.items():
+            frame = label.master
+            fx, fy = frame.winfo_x(), frame.winfo_y()
+            if fx < x2 and fx + frame.winfo_width() > x1 and fy < y2 and fy + frame.winfo_height() > y1:
+                touched.add(path)
+        self._set_selection(self.drag['base'] | touched)
+
+    def on_release(self, event):
+        if self.drag is not None and self.drag['band'] is not None:
+            for edge in self.drag['band']:
+                if edge.winfo_exists():
+                    edge.destroy()
+        self.drag = None
 
     def change_page(self, delta):
         """Navigate to the previous or next page."""
@@ -231,24 +354,74 @@ class ThumbnailViewerWindow:
         self.clicked_image_path = path
         self.context_menu.post(event.x_root, event.y_root)
 
-    def delete_image(self):
+    def delete_clicked(self):
+        """Delete from the context menu: the whole selection if the image is part of it."""
         path = self.clicked_image_path
         if not path: return
-        
-        if messagebox.askyesno(self.app._('confirm_delete_title'), f"确认删除文件?\n{os.path.basename(path)}", parent=self.top):
+        if path in self.selected:
+            self.delete_selected()
+        else:
+            self.delete_paths([path])
+
+    def delete_selected(self):
+        self.delete_paths([p for p in self.selected if p in self.all_images])
+
+    def delete_paths(self, paths):
+        """Confirm once, then delete all `paths` in the background."""
+        if not paths or self.deleting: return
+
+        size = sum(self.all_images.get(p)['size'] for p in paths)
+        if len(paths) == 1:
+            msg = self.app._('confirm_delete_file_msg', os.path.basename(paths[0]))
+        else:
+            msg = self.app._('confirm_delete_selected_msg', len(paths), f"{size / (1024 * 1024):,.2f}")
+        if not messagebox.askyesno(self.app._('confirm_delete_title'), msg, parent=self.top):
+            return
+
+        self.deleting = True
+        self.update_selection_controls()
+        threading.Thread(target=self._delete_paths_thread, args=(paths,), daemon=True).start()
+
+    def _delete_paths_thread(self, paths):
+        deleted, errors = [], []
+        for path in paths:
             try:
                 os.remove(path)
-                self.thumb_labels[path].master.destroy()
-                del self.thumb_labels[path]
-                self.all_images = [img for img in self.all_images if img['path'] != path]
-                self.images_on_page = [img for img in self.images_on_page if img['path'] != path]
-                
-                self.populate_thumbnails(self.images_on_page)
-                self.update_page_controls()
-
-                self.app.file_data[self.year][self.month]['paths'].remove(path)
+                deleted.append(path)
             except Exception as e:
-                messagebox.showerror(self.app._('error_title'), f"删除失败: {e}", parent=self.top)
+                print(f"Could not delete {path}: {e}")
+                errors.append((path, e))
+        # Scheduled on the main window, which outlives this one if it is closed meanwhile
+        self.parent.after(0, lambda: self.finish_delete(deleted, errors))
+
+    def finish_delete(self, deleted, errors):
+        """Drop deleted images from every index in O(1) each, then redraw the page once."""
+        self.deleting = False
+        removed_sizes = {} # path -> size
+        for path in deleted:
+            record = self.all_images.remove(path)
+            removed_sizes[path] = size = record['size'] if record is not None else 0
+            if path in self.selected:
+                self.selected.discard(path)
+                self.selected_size -= size
+            self.photo_references.pop(path, None)
+            self.thumb_labels.pop(path, None)
+
+        if deleted:
+            # Scan results are immutable snapshots; publish one without these files
+            self.app.remove_paths(removed_sizes)
+
+        viewer_open = self.top.winfo_exists()
+        if viewer_open:
+            if deleted:
+                self.update_view(force_reload=False)
+            else:
+                self.update_selection_controls()
+
+        if errors:
+            details = "\n".join(f"{os.path.basename(p)}: {e}" for p, e in errors[:10])
+            messagebox.showerror(self.app._('error_title'), self.app._('error_delete_failed', len(errors), details),
+                                 parent=self.top if viewer_open else self.parent)
 
     def open_image(self):
         if self.clicked_image_path:
@@ -21,6 +21,7 @@ I18N_STRINGS = {
         'year_prefix': "年份: {}",
         'confirm_delete_title': "确认删除",
         'confirm_delete_msg': "您确定要永久删除 {} 年 {} 月及之前的所有文件吗？\n\n此操作无法撤销。\n\n以下是待删除图片的部分随机预览：",
+        'confirm_delete_summary': "共 {} 个文件，{} MB。",
         'confirm_btn': "确认删除",
         'cancel_btn': "取消",
         'language_menu': "语言 (Language)",
@@ -43,7 +44,45 @@ I18N_STRINGS = {
         'context_open': "打开",
         'context_open_dir': "打开所在目录",
         'prev_page': "上一页",
-        'next_page': "下一页"
+        'next_page': "下一页",
+        'recompress_files_btn': "压缩图片",
+        'recompress_title': "压缩图片",
+        'recompress_msg': "将 {} 年 {} 月及之前的图片重新编码以节省空间，原文件会被替换。\n仅在结果明显更小时才会替换，文件的时间保持不变。",
+        'recompress_quality': "JPEG 质量 (10-95):",
+        'recompress_max_side': "最大边长 (像素, 0 表示不限制):",
+        'recompress_min_saving': "最少节省 (%):",
+        'recompress_confirm_btn': "开始压缩",
+        'error_invalid_settings': "请输入有效的压缩设置。",
+        'status_recompressing': "正在压缩... ({}/{}) 已节省 {} MB, {} 个文件/秒, {} MB/秒",
+        'status_recompress_complete': "压缩完成。压缩了 {} 个文件，跳过 {} 个，失败 {} 个，共节省 {} MB，用时 {} 秒。",
+        'status_recompress_cancelled': "用户取消了压缩操作。",
+        'status_recompress_failed': "压缩过程中出现错误，已停止。",
+        'source_menu': "缓存类型",
+        'source_qq_group2': "QQ群聊图片",
+        'source_wechat': "微信图片",
+        'folder_label_wechat': "微信图片文件夹:",
+        'prompt_wechat_id': "请输入您的微信账号文件夹名 (如 wxid_xxx)",
+        'wechat_id_title': "输入微信账号",
+        'error_find_wechat_folder_msg': "未找到对应的微信图片文件夹, 请手动选择。",
+        'quick_estimate_chk': "快速估算",
+        'status_estimating': "快速估算（已扫描 {} / {} 个分片，± 为 95% 置信区间），完整扫描仍在进行...",
+        'select_all': "全选",
+        'select_none': "取消选择",
+        'delete_selected': "删除所选",
+        'selection_label': "已选择 {} 个文件 ({} MB)",
+        'confirm_delete_file_msg': "确认删除文件?\n{}",
+        'confirm_delete_selected_msg': "确认删除所选的 {} 个文件 ({} MB)?\n\n此操作无法撤销。",
+        'error_delete_failed': "{} 个文件删除失败:\n{}",
+        'diagnostics_menu': "诊断",
+        'lag_report_title': "界面卡顿报告",
+        'lag_report_refresh': "刷新",
+        'lag_report_reset': "重置",
+        'bucket_by': "按月份分组依据:",
+        'bucket_mtime': "修改时间",
+        'bucket_content': "内容日期 (EXIF拍摄时间 / 创建时间)",
+        'status_content_dates': "正在读取内容日期... ({}/{})",
+        'status_content_dates_done': "内容日期已就绪。共 {} 个月份的文件。",
+        'status_content_dates_failed': "读取内容日期失败，已切换回修改时间。"
     },
     'en': {
         'window_title': "QQ Group Images Cleaner",
@@ -66,6 +105,7 @@ I18N_STRINGS = {
         'year_prefix': "Year: {}",
         'confirm_delete_title': "Confirm Deletion",
         'confirm_delete_msg': "Are you sure you want to permanently delete all files from and before {month:02d}-{year}?\n\nThis action CANNOT be undone.\n\nA random sample of images to be deleted is shown below:",
+        'confirm_delete_summary': "{} files, {} MB in total.",
         'confirm_btn': "Confirm Deletion",
         'cancel_btn': "Cancel",
         'language_menu': "Language",
@@ -88,6 +128,44 @@ I18N_STRINGS = {
         'context_open': "Open",
         'context_open_dir': "Open Containing Folder",
         'prev_page': "Prev",
-        'next_page': "Next"
+        'next_page': "Next",
+        'recompress_files_btn': "Recompress",
+        'recompress_title': "Recompress Images",
+        'recompress_msg': "Images from and before {}-{:02d} will be re-encoded in place to save space.\nA file is only replaced when the result is meaningfully smaller, and its timestamps are kept.",
+        'recompress_quality': "JPEG quality (10-95):",
+        'recompress_max_side': "Max side in pixels (0 = unlimited):",
+        'recompress_min_saving': "Minimum saving (%):",
+        'recompress_confirm_btn': "Start Recompression",
+        'error_invalid_settings': "Please enter valid recompression settings.",
+        'status_recompressing': "Recompressing... ({}/{}) saved {} MB, {} files/s, {} MB/s",
+        'status_recompress_complete': "Recompression complete. Recompressed {} files, skipped {}, failed {}; saved {} MB in {} s.",
+        'status_recompress_cancelled': "Recompression cancelled by user.",
+        'status_recompress_failed': "Recompression stopped because of an error.",
+        'source_menu': "Cache Type",
+        'source_qq_group2': "QQ Group Images",
+        'source_wechat': "WeChat Images",
+        'folder_label_wechat': "WeChat Image Folder:",
+        'prompt_wechat_id': "Please enter your WeChat account folder name (e.g. wxid_xxx)",
+        'wechat_id_title': "Enter WeChat Account",
+        'error_find_wechat_folder_msg': "Could not find the corresponding WeChat image folder. Please select it manually.",
+        'quick_estimate_chk': "Quick estimate",
+        'status_estimating': "Quick estimate ({} of {} shards scanned, ± is the 95% confidence interval); full scan still running...",
+        'select_all': "Select All",
+        'select_none': "Select None",
+        'delete_selected': "Delete Selected",
+        'selection_label': "{} files selected ({} MB)",
+        'confirm_delete_file_msg': "Delete this file?\n{}",
+        'confirm_delete_selected_msg': "Delete the {} selected files ({} MB)?\n\nThis action CANNOT be undone.",
+        'error_delete_failed': "Failed to delete {} files:\n{}",
+        'diagnostics_menu': "Diagnostics",
+        'lag_report_title': "UI Lag Report",
+        'lag_report_refresh': "Refresh",
+        'lag_report_reset': "Reset",
+        'bucket_by': "Group months by:",
+        'bucket_mtime': "Modified time",
+        'bucket_content': "Content date (EXIF taken time / creation time)",
+        'status_content_dates': "Reading content dates... ({}/{})",
+        'status_content_dates_done': "Content dates ready. Found files grouped into {} months.",
+        'status_content_dates_failed': "Could not read content dates; switched back to modified time."
     }
 }
\ No newline at end of file
@@ -1,10 +1,31 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+import os
+import sys
+import time
 from tkinter import Tk
 from lib.QQCleanerApp import QQCleanerApp 
 
+def install_startup_probe(root, probe_path):
+    """Record the moment the main window is first mapped, then quit (see tools/measure_startup.py)."""
+    def on_map(event):
+        if event.widget is not root:
+            return
+        with open(probe_path, 'w') as f:
+            f.write(repr(time.time()))
+        root.after(0, root.destroy)
+    root.bind('<Map>', on_map)
+
 if __name__ == "__main__":
+    if getattr(sys, 'frozen', False):
+        # Required for the recompression process pool in the packaged executable.
+        # Imported only here since it costs startup time and is a no-op otherwise.
+        import multiprocessing
+        multiprocessing.freeze_support()
     root = Tk()
     app = QQCleanerApp(root)
-    root.mainloop()
\ No newline at end of file
+    probe_path = os.environ.get('QQ_CLEANER_STARTUP_PROBE')
+    if probe_path:
+        install_startup_probe(root, probe_path)
+    root.mainloop()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""Measure the cold-start cost of QQ Group Images Cleaner.
+
+Reports two numbers that can be tracked between versions:
+
+* an ``-X importtime`` breakdown of importing the main window module;
+* the wall-clock time from process launch until the main window is mapped.
+
+Usage:
+    python tools/measure_startup.py                 # run from source
+    python tools/measure_startup.py --exe dist/QQ-Group-Images-Cleaner.exe
+    python tools/measure_startup.py --json startup.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_SCRIPT = os.path.join(REPO_ROOT, 'qq_group_images_cleaner.py')
+MAIN_MODULE = 'lib.QQCleanerApp'
+PROBE_ENV = 'QQ_CLEANER_STARTUP_PROBE'
+
+def measure_import_time(module=MAIN_MODULE):
+    """Return ([(name, self_us, cumulative_us), ...], total_us) from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    total = next((cum for name, _, cum in rows if name == module), 0)
+    return rows, total
+
+def measure_first_window(exe=None, timeout=60):
+    """Launch the app once and return seconds until its main window was mapped."""
+    command = [exe] if exe else [sys.executable, ENTRY_SCRIPT]
+    fd, probe_path = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        env = dict(os.environ, **{PROBE_ENV: probe_path})
+        start = time.time()
+        subprocess.run(command, cwd=REPO_ROOT, env=env, timeout=timeout)
+        with open(probe_path) as f:
+            content = f.read().strip()
+        if not content:
+            raise RuntimeError("The application exited without mapping its main window.")
+        return float(content) - start
+    finally:
+        os.remove(probe_path)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--exe', help="Measure a packaged executable instead of the source tree.")
+    parser.add_argument('--runs', type=int, default=5, help="Number of launches for time-to-first-window.")
+    parser.add_argument('--top', type=int, default=15, help="Number of slowest imports to list.")
+    parser.add_argument('--json', dest='json_path', help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+
+    report = {}
+
+    if not args.exe:
+        rows, total = measure_import_time()
+        report['import_total_ms'] = total / 1000
+        report['slowest_imports'] = [
+            {'module': name, 'self_ms': s / 1000, 'cumulative_ms': c / 1000}
+            for name, s, c in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]
+        ]
+        print(f"import {MAIN_MODULE}: {total / 1000:.1f} ms")
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for row in report['slowest_imports']:
+            print(f"{row['cumulative_ms']:>14.1f} {row['self_ms']:>9.1f}  {row['module']}")
+        print()
+
+    samples = [measure_first_window(args.exe) for _ in range(args.runs)]
+    report['first_window_ms'] = {
+        'min': min(samples) * 1000,
+        'median': statistics.median(samples) * 1000,
+        'max': max(samples) * 1000,
+        'runs': len(samples),
+    }
+    print(f"time to first window over {len(samples)} runs: "
+          f"min {report['first_window_ms']['min']:.0f} ms, "
+          f"median {report['first_window_ms']['median']:.0f} ms, "
+          f"max {report['first_window_ms']['max']:.0f} ms")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
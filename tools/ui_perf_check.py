@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""Headless UI performance check for QQ Group Images Cleaner.
+
+Builds a synthetic Group2 tree, drives the real application under a (virtual)
+X server and checks latency budgets for scan updates, tree redraws and
+thumbnail page flips, using the built-in event-loop lag monitor.
+
+Exits with status 1 if a budget is exceeded and 2 if no display is available.
+
+Usage:
+    xvfb-run -a python tools/ui_perf_check.py
+    python tools/ui_perf_check.py --files 100000 --json ui-perf.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Latency budgets in milliseconds
+BUDGETS = {
+    'scan_lag_p95': 100,
+    'scan_lag_max': 250,
+    'tree_redraw': 150,
+    'language_switch': 250,
+    'viewer_first_page': 1500,
+    'page_flip': 750,
+}
+
+def build_group2_tree(root, total_files, shards, image_month, image_count):
+    """Create `total_files` small files spread over hashed shards and five years of mtimes.
+
+    `image_count` real JPEGs are placed in `image_month` so the thumbnail viewer has
+    something to decode.
+    """
+    from PIL import Image
+
+    rng = random.Random(2024)
+    year_now = time.localtime().tm_year
+    for i in range(total_files):
+        shard = f"{rng.randrange(shards):03X}"
+        folder = os.path.join(root, shard, f"{rng.randrange(16):02X}")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{i:08X}.jpg")
+        with open(path, 'wb') as f:
+            f.write(b'\0' * rng.randrange(1, 512))
+        year, month = year_now - rng.randrange(5), rng.randrange(1, 13)
+        mtime = time.mktime((year, month, 15, 12, 0, 0, 0, 0, -1))
+        os.utime(path, (mtime, mtime))
+
+    year, month = image_month
+    mtime = time.mktime((year, month, 15, 12, 0, 0, 0, 0, -1))
+    for i in range(image_count):
+        folder = os.path.join(root, f"{rng.randrange(shards):03X}", 'IMG')
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"image{i:05d}.jpg")
+        Image.new('RGB', (640, 480), (rng.randrange(256), rng.randrange(256), rng.randrange(256))).save(path, 'JPEG')
+        os.utime(path, (mtime, mtime))
+
+def ensure_display():
+    """Return a handle to stop a virtual display we started, or None if one already exists."""
+    if sys.platform == 'win32' or sys.platform == 'darwin' or os.environ.get('DISPLAY'):
+        return None
+    try:
+        from pyvirtualdisplay import Display
+    except ImportError:
+        Display = None
+    if Display is not None:
+        display = Display(visible=False, size=(1280, 1024))
+        display.start()
+        return display.stop
+    if shutil.which('Xvfb'):
+        number = ':%d' % random.randrange(100, 999)
+        process = subprocess.Popen(['Xvfb', number, '-screen', '0', '1280x1024x24'],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        time.sleep(1)
+        os.environ['DISPLAY'] = number
+        return process.terminate
+    print("No display available. Run under xvfb-run, or install Xvfb or pyvirtualdisplay.")
+    sys.exit(2)
+
+def pump(root, until, timeout):
+    """Run the Tk event loop until `until()` is true."""
+    deadline = time.perf_counter() + timeout
+    while not until():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("UI did not reach the expected state in time")
+        root.update()
+        time.sleep(0.001)
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+def run_checks(tree_root, image_month, pages):
+    from tkinter import Tk, Toplevel, TclError
+    from lib.QQCleanerApp import QQCleanerApp
+    from lib.ThumbnailViewerWindow import ThumbnailViewerWindow
+
+    # Window grabs can fail on an unmapped virtual display and are irrelevant here
+    original_grab_set = Toplevel.grab_set
+    def grab_set(self):
+        try:
+            original_grab_set(self)
+        except TclError:
+            pass
+    Toplevel.grab_set = grab_set
+
+    root = Tk()
+    root.geometry('1000x700')
+    app = QQCleanerApp(root, warm_up=False)
+    pump(root, lambda: root.winfo_viewable(), 10)
+    results = {}
+
+    # --- Scan: the event loop must stay responsive while results stream in ---
+    scan_done = []
+    original_finish_scan = app.finish_scan
+    def finish_scan(*args):
+        original_finish_scan(*args)
+        scan_done.append(True)
+    app.finish_scan = finish_scan
+
+    app.set_folder_path(tree_root)
+    app.lag_monitor.reset()
+    app.start_scan()
+    pump(root, lambda: scan_done, 600)
+    results['scan_lag_p95'] = app.lag_monitor.percentile(0.95) * 1000
+    results['scan_lag_max'] = max(app.lag_monitor.lags, default=0) * 1000
+    scan_report = app.lag_monitor.report()
+
+    # --- Tree redraws ---
+    results['tree_redraw'] = max(timed(app.update_treeview) for _ in range(5))
+    results['language_switch'] = max(timed(lambda lang=lang: app.set_language(lang)) for lang in ('en', 'zh', 'en', 'zh'))
+
+    # --- Thumbnail viewer: first page and page flips ---
+    year, month = image_month
+    populated = []
+    original_populate = ThumbnailViewerWindow.populate_thumbnails
+    def populate_thumbnails(self, image_data):
+        original_populate(self, image_data)
+        populated.append(time.perf_counter())
+    ThumbnailViewerWindow.populate_thumbnails = populate_thumbnails
+
+    start = time.perf_counter()
+    viewer = ThumbnailViewerWindow(root, app, app.file_data[year][month]['paths'], year, month)
+    pump(root, lambda: populated, 60)
+    results['viewer_first_page'] = (populated[-1] - start) * 1000
+
+    flips = []
+    for _ in range(min(pages, viewer.total_pages - 1)):
+        populated.clear()
+        start = time.perf_counter()
+        viewer.change_page(1)
+        pump(root, lambda: populated, 60)
+        flips.append((populated[-1] - start) * 1000)
+    results['page_flip'] = max(flips, default=0)
+
+    root.destroy()
+    return results, scan_report
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=50000, help="Number of synthetic cache files.")
+    parser.add_argument('--shards', type=int, default=256, help="Number of top-level Group2 shards.")
+    parser.add_argument('--images', type=int, default=200, help="Real images placed in one month for the viewer.")
+    parser.add_argument('--pages', type=int, default=5, help="Number of page flips to time.")
+    parser.add_argument('--json', dest='json_path', help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+
+    stop_display = ensure_display()
+    tree_root = tempfile.mkdtemp(prefix='group2-')
+    try:
+        image_month = (time.localtime().tm_year - 6, 6) # A month no synthetic file falls into
+        print(f"Building a synthetic Group2 tree with {args.files:,} files in {tree_root} ...")
+        build_group2_tree(tree_root, args.files, args.shards, image_month, args.images)
+        results, scan_report = run_checks(tree_root, image_month, args.pages)
+    finally:
+        shutil.rmtree(tree_root, ignore_errors=True)
+        if stop_display:
+            stop_display()
+
+    print("\nEvent loop during the scan:\n" + scan_report + "\n")
+    failed = []
+    print(f"{'check':<20} {'measured ms':>12} {'budget ms':>10}")
+    for name, budget in BUDGETS.items():
+        measured = results[name]
+        ok = measured <= budget
+        if not ok:
+            failed.append(name)
+        print(f"{name:<20} {measured:>12.1f} {budget:>10}  {'ok' if ok else 'OVER BUDGET'}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'results_ms': results, 'budgets_ms': BUDGETS, 'failed': failed}, f, indent=2)
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()